@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: pstaif
+
+Dávkový řešič osmisměrek bez Streamlitu. Načítá zadání postupně
+z adresáře (*.txt) nebo ze souboru JSONL, řeší je paralelně ve
+skupině procesů a výsledky průběžně zapisuje jako JSONL.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from osmismerka import text_to_matrix, find_words_in_matrix, find_remaining_letters
+
+
+def parse_words(words):
+    # Slova lze zadat buď jako seznam, nebo jako řetězec oddělený
+    # mezerami (stejně jako ve Streamlit aplikaci). Prázdné položky
+    # vzniklé vícenásobnými mezerami se zahodí.
+    if isinstance(words, str):
+        words = words.split()
+    return [word.strip().upper() for word in words if word.strip()]
+
+
+def read_puzzle_file(path):
+    # Textový soubor se zadáním obsahuje nejprve řádky matice, poté
+    # prázdný řádek a za ním slova oddělená mezerami nebo novými řádky.
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    matrix_text, _, words_text = content.strip().partition("\n\n")
+    return {"id": os.path.basename(path), "matrix": matrix_text, "words": words_text}
+
+
+def iter_puzzles(source):
+    # Generátor, který vrací zadání jedno po druhém, takže v paměti
+    # je vždy jen to, které se právě odesílá ke zpracování. Adresář
+    # se prochází seřazeně kvůli stabilnímu pořadí výstupu, u JSONL
+    # se jako id použije číslo řádku, pokud záznam vlastní id nemá.
+    # Poškozené řádky se nepřeskakují, ale předají se dál jako chyba.
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(".txt"):
+                yield read_puzzle_file(os.path.join(source, name))
+        return
+
+    with open(source, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                puzzle = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {"id": line_number, "error": f"Invalid JSON: {e}"}
+                continue
+            if not isinstance(puzzle, dict):
+                yield {"id": line_number, "error": "Puzzle must be a JSON object."}
+                continue
+            puzzle.setdefault("id", line_number)
+            yield puzzle
+
+
+def solve_puzzle(puzzle):
+    # Vyřeší jedno zadání a vrátí slovník připravený k zápisu do JSONL.
+    # Běží v pracovním procesu, proto nesmí vyhazovat výjimky kvůli
+    # chybnému vstupu - chyba se vrátí v poli "error".
+    result = {"id": puzzle.get("id")}
+    if "error" in puzzle:
+        result["error"] = puzzle["error"]
+        return result
+
+    matrix_text = puzzle.get("matrix", "")
+    if isinstance(matrix_text, list) and all(isinstance(row, str) for row in matrix_text):
+        matrix_text = "\n".join(matrix_text)
+    if not isinstance(matrix_text, str):
+        result["error"] = "The letter matrix must be a string or a list of strings."
+        return result
+    words = puzzle.get("words", [])
+    if not (isinstance(words, str) or (isinstance(words, list) and all(isinstance(word, str) for word in words))):
+        result["error"] = "The words must be a string or a list of strings."
+        return result
+    word_list = parse_words(words)
+
+    start = time.perf_counter()
+    matrix = text_to_matrix(matrix_text) if matrix_text.strip() else []
+    parsed = time.perf_counter()
+    if not matrix:
+        result["error"] = "Please enter a valid letter matrix."
+        return result
+    if not all(len(row) == len(matrix[0]) for row in matrix):
+        result["error"] = "The rows in the letter matrix must have the same length."
+        return result
+
+    found_words = find_words_in_matrix(matrix, word_list)
+    solved = time.perf_counter()
+    remaining_word = find_remaining_letters(matrix, found_words)
+    finished = time.perf_counter()
+
+    result["found_words"] = found_words
+    result["missing_words"] = [word for word in word_list if word not in found_words]
+    result["remaining_letters"] = remaining_word
+    result["timings_ms"] = {
+        "parse": round((parsed - start) * 1000, 3),
+        "find_words": round((solved - parsed) * 1000, 3),
+        "remaining_letters": round((finished - solved) * 1000, 3),
+    }
+    return result
+
+
+def _collect(puzzle_id, get_result):
+    # Vrátí výsledek zadání, nebo chybový záznam, pokud jeho získání
+    # skončilo výjimkou (např. v pracovním procesu).
+    try:
+        return get_result()
+    except Exception as e:
+        return {"id": puzzle_id, "error": f"{type(e).__name__}: {e}"}
+
+
+def solve_stream(puzzles, workers, max_pending):
+    # Rozesílá zadání do skupiny procesů, ale nikdy nemá rozpracováno
+    # víc než max_pending úloh. Pool.map/imap by si načetl celý vstup
+    # dopředu, takto zůstává spotřeba paměti konstantní bez ohledu na
+    # počet zadání. Výsledky se vrací ve stejném pořadí jako vstup.
+    # Neočekávaná chyba při řešení jednoho zadání se převede na záznam
+    # s polem "error", aby nezastavila zpracování ostatních.
+    if workers <= 1:
+        for puzzle in puzzles:
+            yield _collect(puzzle.get("id"), lambda: solve_puzzle(puzzle))
+        return
+
+    # Pokud pracovní proces spadne (např. ho ukončí systém kvůli
+    # nedostatku paměti), skupina procesů se rozbije: rozpracovaná
+    # zadání skončí chybovým záznamem a další zadání se odešlou do
+    # nově vytvořené skupiny.
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for puzzle in puzzles:
+            try:
+                future = executor.submit(solve_puzzle, puzzle)
+            except BrokenProcessPool:
+                executor.shutdown(wait=False)
+                executor = ProcessPoolExecutor(max_workers=workers)
+                future = executor.submit(solve_puzzle, puzzle)
+            pending.append((puzzle.get("id"), future))
+            if len(pending) >= max_pending:
+                puzzle_id, future = pending.popleft()
+                yield _collect(puzzle_id, future.result)
+        while pending:
+            puzzle_id, future = pending.popleft()
+            yield _collect(puzzle_id, future.result)
+    finally:
+        executor.shutdown()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many word-search puzzles without the Streamlit UI.")
+    parser.add_argument("source", help="directory with *.txt puzzles or a JSONL file (one puzzle per line)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file for the results (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--max-pending", type=int, default=None, help="maximum number of puzzles in flight (default: 4 x workers)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.source):
+        parser.error(f"{args.source} does not exist")
+    max_pending = args.max_pending or 4 * max(args.workers, 1)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    solved = failed = 0
+    try:
+        for result in solve_stream(iter_puzzles(args.source), args.workers, max_pending):
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            if "error" in result:
+                failed += 1
+            else:
+                solved += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Solved {solved} puzzles, {failed} failed.", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
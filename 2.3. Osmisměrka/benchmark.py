@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: pstaif
+
+Benchmark hledání slov. Pro každou velikost matice vygeneruje zadání
+(generator.py), spustí na něm všechny implementace ze SOLVER_BACKENDS,
+ověří, že vrací shodné výsledky, a vypíše čas, špičkovou paměť a počet
+buněk za sekundu jako tabulku a volitelně jako JSON.
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from generator import DEFAULT_WORDS, generate_puzzle, load_dictionary
+from matrix_index import find_words_with_index
+from osmismerka import find_words_in_matrix, find_words_in_matrix_iterative
+
+# Všechny dostupné implementace hledání slov se stejným rozhraním
+# (matrix, word_list) -> found_words. První z nich slouží jako
+# reference, se kterou se porovnávají výsledky ostatních.
+SOLVER_BACKENDS = {
+    "recursive": find_words_in_matrix,
+    "iterative": find_words_in_matrix_iterative,
+    "index": find_words_with_index,
+}
+
+# Výchozí velikosti doběhnou zhruba za 10 s. Matice 1000 x 1000
+# (asi 3 minuty) a 2000 x 2000 (asi 13 minut, backend index přes
+# 2 GB paměti) se spouští jen na vyžádání přes --sizes.
+DEFAULT_SIZES = [10, 50, 100, 200]
+
+
+def _max_rss_bytes():
+    # ru_maxrss je na Linuxu v KiB, na macOS v bajtech.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _timed_runs(backend, matrix, word_list, repeat):
+    # Nejlepší čas z repeat běhů a výsledek posledního z nich.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found_words = backend(matrix, word_list)
+        best = min(best, time.perf_counter() - start)
+    return found_words, best
+
+
+def _measure_in_child(connection, backend, matrix, word_list, repeat):
+    baseline = _max_rss_bytes()
+    found_words, best = _timed_runs(backend, matrix, word_list, repeat)
+    connection.send((found_words, best, _max_rss_bytes() - baseline))
+    connection.close()
+
+
+def measure(backend, matrix, word_list, repeat):
+    # Každý backend běží v samostatném procesu vzniklém přes fork, takže
+    # špičkovou paměť lze odečíst z ru_maxrss jako nárůst oproti stavu
+    # při startu procesu. Na rozdíl od tracemalloc to běh nezpomaluje
+    # a měří se přímo časované běhy. Kde fork nebo modul resource
+    # chybí (Windows), běží backend v tomto procesu bez měření paměti.
+    if resource is None or "fork" not in multiprocessing.get_all_start_methods():
+        found_words, best = _timed_runs(backend, matrix, word_list, repeat)
+        return found_words, best, None
+
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure_in_child, args=(sender, backend, matrix, word_list, repeat))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        process.join()
+        raise RuntimeError(f"backend process exited with code {process.exitcode}") from None
+    process.join()
+    return result
+
+
+def run_benchmark(sizes, backends, dictionary=DEFAULT_WORDS, seed=0, repeat=1, density=0.6, overlap=0.3):
+    # Vrací seznam záznamů (jeden pro každou dvojici velikost/backend).
+    # Pole "matches_reference" říká, zda backend našel přesně totéž
+    # co první backend v pořadí.
+    records = []
+    for size in sizes:
+        puzzle = generate_puzzle(size, size, dictionary, seed=seed, density=density, overlap=overlap)
+        matrix = [list(row) for row in puzzle["matrix"]]
+        word_list = puzzle["words"]
+        reference = None
+        for name in backends:
+            found_words, seconds, peak = measure(SOLVER_BACKENDS[name], matrix, word_list, repeat)
+            if reference is None:
+                reference = found_words
+            records.append({
+                "size": f"{size}x{size}",
+                "cells": size * size,
+                "words": len(word_list),
+                "backend": name,
+                "seconds": seconds,
+                "peak_memory_bytes": peak,
+                "cells_per_second": size * size / seconds if seconds else None,
+                "occurrences": sum(len(paths) for paths in found_words.values()),
+                "matches_reference": found_words == reference,
+            })
+    return records
+
+
+def format_table(records):
+    header = ["size", "backend", "time [s]", "peak mem [KiB]", "cells/s", "found", "identical"]
+    rows = [[
+        record["size"],
+        record["backend"],
+        f"{record['seconds']:.4f}",
+        f"{record['peak_memory_bytes'] / 1024:.1f}" if record["peak_memory_bytes"] is not None else "-",
+        f"{record['cells_per_second']:,.0f}" if record["cells_per_second"] else "-",
+        str(record["occurrences"]),
+        "yes" if record["matches_reference"] else "NO",
+    ] for record in records]
+    widths = [max(len(line[i]) for line in [header] + rows) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(line, widths)) for line in [header] + rows]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark all word-search backends on generated puzzles.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="square matrix sizes, e.g. 10 100 2000")
+    parser.add_argument("--backends", nargs="+", choices=sorted(SOLVER_BACKENDS), default=list(SOLVER_BACKENDS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per backend, the best one is reported")
+    parser.add_argument("--dictionary", help="text file with one word per line (default: words from the demo puzzle)")
+    parser.add_argument("--density", type=float, default=0.6)
+    parser.add_argument("--overlap", type=float, default=0.3)
+    parser.add_argument("--json", help="write the results as JSON to this file ('-' for stdout instead of the table)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    dictionary = load_dictionary(args.dictionary) if args.dictionary else DEFAULT_WORDS
+    records = run_benchmark(args.sizes, args.backends, dictionary, seed=args.seed, repeat=args.repeat,
+                            density=args.density, overlap=args.overlap)
+
+    if args.json == "-":
+        print(json.dumps(records, indent=2))
+    else:
+        print(format_table(records))
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=2)
+
+    if not all(record["matches_reference"] for record in records):
+        print("Backends returned different results!", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: pstaif
+
+Generátor osmisměrek se semínkem pro testování a benchmarky. Slova ze
+slovníku se vkládají do matice v náhodných směrech, zbylé buňky se
+doplní náhodnými písmeny. Výstup je ve formátu JSONL, který umí číst
+batch_solver.py.
+"""
+
+import argparse
+import json
+import random
+import sys
+
+from osmismerka import DIRECTIONS
+
+# Výchozí slovník - slova z ukázkového zadání ve Streamlit aplikaci.
+DEFAULT_WORDS = ["ALKA", "HORA", "JUTA", "KAPLE", "KARPATY", "KARTA", "KASA", "KAVKA", "KLAS", "KOSMONAUT",
+                 "KOST", "KROK", "LAPKA", "MATKA", "OKRASA", "OPAT", "OSMA", "PAKT", "PATKA", "PIETA", "POCEL",
+                 "POVLAK", "PROHRA", "SEKERA", "SHODA", "SOPKA", "TAKT", "TAKTIKA", "TLAK", "VOLHA"]
+
+
+def load_dictionary(path):
+    # Slovník je textový soubor s jedním slovem na řádek.
+    with open(path, encoding="utf-8") as f:
+        return [line.strip().upper() for line in f if line.strip()]
+
+
+def generate_puzzle(rows, cols, dictionary=DEFAULT_WORDS, seed=0, density=0.6, overlap=0.3, max_attempts=50):
+    # Vytvoří jedno zadání velikosti rows x cols. Slova se vkládají,
+    # dokud vložená písmena nepokrývají podíl density všech buněk.
+    # Parametr overlap (0 až 1) určuje pravděpodobnost, s jakou se
+    # přijme umístění, které sdílí buňky (se shodným písmenem) s již
+    # vloženými slovy. Slovo, které se nepodaří umístit ani po
+    # max_attempts pokusech, se přeskočí. Stejné semínko dává vždy
+    # stejné zadání.
+    rng = random.Random(seed)
+    words = [word for word in dictionary if 0 < len(word) <= max(rows, cols)]
+    alphabet = sorted(set("".join(words))) or ["A"]
+    grid = [[None] * cols for _ in range(rows)]
+    placements = []
+    target = int(rows * cols * density)
+    covered = 0
+    failures = 0
+
+    while words and covered < target and failures < max_attempts:
+        word = rng.choice(words)
+        placed = False
+        for _ in range(max_attempts):
+            dr, dc = rng.choice(DIRECTIONS)
+            length = len(word) - 1
+            r_min, r_max = max(0, -dr * length), rows - max(0, dr * length)
+            c_min, c_max = max(0, -dc * length), cols - max(0, dc * length)
+            if r_min >= r_max or c_min >= c_max:
+                continue
+            r, c = rng.randrange(r_min, r_max), rng.randrange(c_min, c_max)
+            path = [(r + dr * i, c + dc * i) for i in range(len(word))]
+            cells = [grid[pr][pc] for pr, pc in path]
+            if any(cell is not None and cell != letter for cell, letter in zip(cells, word)):
+                continue
+            shared = sum(cell is not None for cell in cells)
+            if shared == len(word) or (shared and rng.random() >= overlap):
+                continue
+            for (pr, pc), letter in zip(path, word):
+                grid[pr][pc] = letter
+            covered += len(word) - shared
+            placements.append({"word": word, "row": r, "col": c, "direction": [dr, dc]})
+            placed = True
+            break
+        failures = 0 if placed else failures + 1
+
+    for row in grid:
+        filler = iter(rng.choices(alphabet, k=row.count(None)))
+        row[:] = [next(filler) if cell is None else cell for cell in row]
+
+    return {
+        "id": f"{rows}x{cols}-seed{seed}",
+        "matrix": ["".join(row) for row in grid],
+        "words": sorted(set(dictionary)),
+        "placements": placements,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate seeded word-search puzzles as JSONL.")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=None, help="number of columns (default: same as --rows)")
+    parser.add_argument("-n", "--count", type=int, default=1, help="number of puzzles to generate")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first puzzle, following puzzles use seed+1, seed+2, ...")
+    parser.add_argument("--dictionary", help="text file with one word per line (default: words from the demo puzzle)")
+    parser.add_argument("--density", type=float, default=0.6, help="fraction of cells covered by planted words")
+    parser.add_argument("--overlap", type=float, default=0.3, help="probability of accepting a placement that shares cells")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    dictionary = load_dictionary(args.dictionary) if args.dictionary else DEFAULT_WORDS
+    cols = args.cols or args.rows
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for i in range(args.count):
+            puzzle = generate_puzzle(args.rows, cols, dictionary, seed=args.seed + i,
+                                     density=args.density, overlap=args.overlap)
+            out.write(json.dumps(puzzle, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: pstaif
+
+Index nad jednou maticí osmisměrky pro opakované dotazy. Všechny řádky
+matice v osmi směrech se spojí do jednoho textu, nad kterým se jednou
+postaví sufixové pole. Dotaz na slovo nebo vzor se zástupným znakem
+'?' (např. "K?AS" nebo "P????" pro všechna pětipísmenná slova začínající
+na P) se pak řeší binárním vyhledáváním místo procházení celé matice.
+"""
+
+from array import array
+from bisect import bisect_right
+
+from osmismerka import DIRECTIONS
+
+SEPARATOR = "\n"
+WILDCARD = "?"
+
+
+def _build_suffix_array(text, depth):
+    # Sufixové pole metodou zdvojování prefixů. Sufixy stačí seřadit
+    # podle prvních depth znaků, protože žádný dotaz nemůže být delší
+    # než nejdelší řádek matice. Díky tomu je počet průchodů omezen
+    # logaritmem délky řádku, ne délky celého textu. Dvojice pořadí
+    # (rank[i], rank[i + k]) se spolu s pozicí i skládá do jednoho
+    # celého čísla, takže se řadí jediný seznam čísel bez n-tic a bez
+    # klíčové funkce. Pole pořadí a výsledek se drží v array('i').
+    n = len(text)
+    rank = array("i", map(ord, text))
+    suffix_array = array("i", sorted(range(n), key=rank.__getitem__))
+    sorted_length = 1
+    while n and sorted_length < depth:
+        k = sorted_length
+        base = max(n, max(rank)) + 2
+        keys = [((rank[i] * base + (rank[i + k] + 1 if i + k < n else 0)) * n) + i for i in range(n)]
+        keys.sort()
+        current, previous = 0, keys[0] // n
+        for j, packed in enumerate(keys):
+            pair, i = divmod(packed, n)
+            if pair != previous:
+                current += 1
+                previous = pair
+            rank[i] = current
+            suffix_array[j] = i
+        del keys
+        sorted_length *= 2
+        if current == n - 1:
+            break
+    return suffix_array
+
+
+class MatrixIndex:
+    # Index se staví jednou pro danou matici (ve Streamlit aplikaci se
+    # uchovává v st.session_state) a odpovídá na libovolné množství
+    # dotazů. Výsledky mají stejný formát jako find_words_in_matrix:
+    # slovník slovo -> seznam cest, kde cesta je seznam souřadnic (r, c).
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.rows = len(matrix)
+        self.cols = len(matrix[0]) if self.rows > 0 else 0
+
+        # Místo údajů o každém znaku textu se ukládá jen začátek, délka,
+        # počáteční buňka a směr každého řádku. Buňku, směr a počet
+        # znaků do konce řádku pro libovolnou pozici v textu dopočítá
+        # _locate pomocí bisect nad začátky řádků.
+        lines = []
+        self._line_starts = array("i")
+        self._line_lengths = array("i")
+        self._line_rows = array("i")
+        self._line_cols = array("i")
+        self._line_directions = array("b")
+        offset = 0
+        for d, (dr, dc) in enumerate(DIRECTIONS):
+            for r in range(self.rows):
+                for c in range(self.cols):
+                    if 0 <= r - dr < self.rows and 0 <= c - dc < self.cols:
+                        continue  # buňka není začátkem řádku v tomto směru
+                    line = []
+                    lr, lc = r, c
+                    while 0 <= lr < self.rows and 0 <= lc < self.cols:
+                        line.append(matrix[lr][lc])
+                        lr, lc = lr + dr, lc + dc
+                    lines.append("".join(line))
+                    self._line_starts.append(offset)
+                    self._line_lengths.append(len(line))
+                    self._line_rows.append(r)
+                    self._line_cols.append(c)
+                    self._line_directions.append(d)
+                    offset += len(line) + 1
+
+        self._text = "".join(line + SEPARATOR for line in lines)
+        longest_line = max(self._line_lengths, default=0)
+        del lines
+        self._suffix_array = _build_suffix_array(self._text, longest_line + 1)
+
+    def _locate(self, p):
+        # Vrací (řádek v textu, posun v řádku) pro pozici p.
+        line = bisect_right(self._line_starts, p) - 1
+        return line, p - self._line_starts[line]
+
+    def _remaining(self, p):
+        # Počet znaků od pozice p do konce jejího řádku (0 pro oddělovač).
+        line, i = self._locate(p)
+        return max(self._line_lengths[line] - i, 0)
+
+    def _cell(self, p):
+        # Buňka (r, c) a index směru d, kterým odpovídá pozice p.
+        line, i = self._locate(p)
+        d = self._line_directions[line]
+        dr, dc = DIRECTIONS[d]
+        return self._line_rows[line] + dr * i, self._line_cols[line] + dc * i, d
+
+    def _suffix_range(self, literal):
+        # Vrací rozsah [lo, hi) v sufixovém poli, kde sufixy začínají
+        # řetězcem literal. Dvě binární vyhledávání, každé O(m log n).
+        text, suffix_array, m = self._text, self._suffix_array, len(literal)
+        lo, hi = 0, len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[suffix_array[mid]:suffix_array[mid] + m] < literal:
+                lo = mid + 1
+            else:
+                hi = mid
+        start, hi = lo, len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[suffix_array[mid]:suffix_array[mid] + m] == literal:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def _match_positions(self, pattern):
+        # Najde všechny pozice v textu, kde začíná shoda se vzorem.
+        # Ze vzoru se vybere nejdelší úsek bez zástupných znaků, jeho
+        # výskyty se najdou v sufixovém poli a zbytek vzoru se ověří
+        # jen u těchto kandidátů. Vzor jen ze zástupných znaků odpovídá
+        # každému dost dlouhému úseku řádku.
+        m = len(pattern)
+        literals = list(self._literal_parts(pattern))
+        if not literals:
+            return [start + i
+                    for start, length in zip(self._line_starts, self._line_lengths)
+                    for i in range(length - m + 1)]
+
+        offset, anchor = max(literals, key=lambda item: len(item[1]))
+        lo, hi = self._suffix_range(anchor)
+        positions = []
+        for i in range(lo, hi):
+            p = self._suffix_array[i] - offset
+            if p < 0 or self._remaining(p) < m:
+                continue
+            if all(self._text[p + o:p + o + len(part)] == part for o, part in literals):
+                positions.append(p)
+        return positions
+
+    @staticmethod
+    def _literal_parts(pattern):
+        # Rozdělí vzor na souvislé úseky bez zástupných znaků spolu
+        # s jejich posunem od začátku vzoru.
+        start = None
+        for i, ch in enumerate(pattern + WILDCARD):
+            if ch != WILDCARD and start is None:
+                start = i
+            elif ch == WILDCARD and start is not None:
+                yield start, pattern[start:i]
+                start = None
+
+    def _paths(self, positions, length):
+        # Převede pozice v textu na cesty v matici, seřazené stejně
+        # jako ve find_words_in_matrix (řádek, sloupec, směr).
+        found = {}
+        for r, c, d in sorted(self._cell(p) for p in positions):
+            dr, dc = DIRECTIONS[d]
+            path = [(r + dr * i, c + dc * i) for i in range(length)]
+            word = "".join(self.matrix[pr][pc] for pr, pc in path)
+            found.setdefault(word, []).append(path)
+        return found
+
+    def find(self, word):
+        # Všechny výskyty jednoho slova (bez zástupných znaků).
+        if not word:
+            return [[] for _ in range(self.rows * self.cols * len(DIRECTIONS))]
+        lo, hi = self._suffix_range(word)
+        positions = [p for p in self._suffix_array[lo:hi] if self._remaining(p) >= len(word)]
+        return self._paths(positions, len(word)).get(word, [])
+
+    def find_words(self, word_list):
+        # Náhrada za find_words_in_matrix nad již postaveným indexem.
+        found_words = {}
+        for word in word_list:
+            found_word_locations = self.find(word)
+            if found_word_locations:
+                found_words[word] = found_word_locations
+        return found_words
+
+    def query(self, pattern):
+        # Dotaz se zástupnými znaky '?'. Vrací slovník skutečně
+        # nalezené slovo -> seznam cest, seřazený podle slova.
+        if not pattern:
+            return {}
+        found = self._paths(self._match_positions(pattern), len(pattern))
+        return dict(sorted(found.items()))
+
+
+def find_words_with_index(matrix, word_list):
+    # Rozhraní shodné s find_words_in_matrix (pro SOLVER_BACKENDS).
+    # Zahrnuje i stavbu indexu, takže se vyplatí hlavně při opakovaných
+    # dotazech nad stejnou maticí.
+    return MatrixIndex(matrix).find_words(word_list)
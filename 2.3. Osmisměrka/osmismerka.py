@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: pstaif
+
+Jádro osmisměrky bez závislosti na Streamlitu, aby ho mohla používat
+jak webová aplikace (řešení_2.3.py), tak dávkový řešič (batch_solver.py).
+"""
+
+# Osm směrů hledání (řádek, sloupec). Pořadí určuje pořadí nalezených
+# cest, proto ho sdílí všechny moduly, které s nimi pracují.
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1), (0, -1), (-1, 0), (-1, 1), (-1, -1)]
+
+def text_to_matrix(text_input):
+    # Funcke která bere text jako input, poté ho rozdelí
+    # na řádky na základě '\n' indikátoru nového řádku. Individualní
+    # písmena jsou populována do matice, ktera je poté funkcí vrácena. 
+    rows = text_input.strip().split('\n')
+    matrix = [list(row.strip()) for row in rows]
+    return matrix
+
+def find_words_in_matrix(matrix, word_list):
+    # Tato funkce slouží ke hledáni slov v matici (osmisměrky). 
+    # Hledá v ní všechna slova ze zadaného seznamu slov (word_list). 
+    # Hledání probíhá horizontálně, vertikálně a diagonálně ve 
+    # všech osmi směrech.  
+    found_words = {}
+    rows = len(matrix)
+    cols = len(matrix[0]) if rows > 0 else 0
+    
+    def search(r, c, word, index, direction):
+        # Tato vnitřní funkce je rekurzivní a slouží k prohledání 
+        # jednoho konkrétního slova (word) z dané počáteční pozice (r, c) 
+        # v zadaném směru z tuplu direction.
+        
+        if index == len(word):
+          return True, []
+      
+        if not (0 <= r < rows and 0 <= c < cols and matrix[r][c] == word[index]):
+          return False, None
+      
+        next_r, next_c = r + direction[0], c + direction[1]
+        found, rest_of_path = search(next_r, next_c, word, index + 1, direction)
+        if found:
+          return True, [(r, c)] + rest_of_path
+        return False, None
+    
+
+    # Následující loop na začátku pro každé hledané word se 
+    # inicializuje prázdný seznam found_word_locations, který 
+    # ukládá všechny nalezené cesty (sekvence souřadnic) pro dané 
+    # slovo v matici. Pro každé slovo iteruje přes všechny buňky matice 
+    # jako potenciální počátek a pro každý směr volá rekurzivní funkci 
+    # search, která ověřuje existenci slova. Pokud se slovo najde, uloží se
+    # seznam souřadnic jeho písmen do seznamu found_word_locations pro 
+    # dané slovo. Nakonec, pokud pro dané slovo existují nějaké nalezené pozice, 
+    # uloží se toto slovo jako klíč a seznam jeho pozic jako hodnota do 
+    # slovníku found_words, který je na konci funkce vrácen.
+  
+    for word in word_list:
+        found_word_locations = []
+        for r in range(rows):
+          for c in range(cols):
+            for direction in DIRECTIONS:
+              found, path = search(r, c, word, 0, direction)
+              if found:
+                found_word_locations.append(path)
+        if found_word_locations:
+          found_words[word] = found_word_locations
+    
+    return found_words
+
+def find_remaining_letters(matrix, found_words): 
+    # Tato funkce má za úkol najít všechna písmena v původní 
+    # matici, která nejsou součástí žádného z nalezených slov. 
+    # Poté tato zbývající písmena spojí do jednoho slova.
+    rows = len(matrix)
+    cols = len(matrix[0]) if rows > 0 else 0
+    colored_cells = set()
+    remaining_letters = []
+    
+    
+    # Tento trojitý for loop iteruje přes všechny nalezené pozice 
+    # písmen, které tvoří hledaná slova. Začíná procházením všech 
+    # seznamů pozic (locations_list) uložených jako hodnoty ve 
+    # slovníku found_words. Pro každý takový seznam 
+    # (který reprezentuje všechny výskyty jednoho slova) 
+    # iteruje přes jednotlivé nalezené cesty (locations), 
+    # kde každá cesta je seznamem souřadnic (r, c) písmen 
+    # tvořících daný výskyt slova. V nejvnitřnější smyčce se 
+    # pak pro každou souřadnici (r, c) písmene, které je 
+    # součástí nalezeného slova, tato souřadnice přidá do 
+    # množiny colored_cells. Množina je použita proto, aby 
+    # se zajistilo, že každá souřadnice je uložena pouze jednou, 
+    # i když se dané písmeno může vyskytovat ve více nalezených slovech.
+    for locations_list in found_words.values():
+      for locations in locations_list:
+        for r, c in locations:
+          colored_cells.add((r, c))
+    
+    
+    # Tento loop iteruje matici po řádcích a sloupcích. Pro 
+    # každou buňku zkontroluje, zda její souřadnice nejsou v 
+    # colored_cells (souřadnice písmen nalezených slov). 
+    # Pokud nejsou, písmeno z této buňky se přidá do 
+    # seznamu remaining_letters.
+    for r in range(rows):
+      for c in range(cols):
+        if (r, c) not in colored_cells:
+          remaining_letters.append(matrix[r][c])
+    
+    return "".join(remaining_letters)
+
+def find_words_in_matrix_iterative(matrix, word_list):
+    # Iterativní varianta funkce find_words_in_matrix se stejným
+    # výstupem (včetně pořadí nalezených cest). Místo rekurze z každé
+    # buňky nejprve seskupí pozice podle písmene, takže se slovo
+    # zkouší jen z buněk, kde leží jeho první písmeno. Pro každý směr
+    # se předem ověří, zda se celé slovo vejde do matice, a písmena
+    # se pak porovnávají v jednoduché smyčce.
+    found_words = {}
+    rows = len(matrix)
+    cols = len(matrix[0]) if rows > 0 else 0
+
+    positions_by_letter = {}
+    for r in range(rows):
+      for c in range(cols):
+        positions_by_letter.setdefault(matrix[r][c], []).append((r, c))
+
+    for word in word_list:
+        found_word_locations = []
+        if not word:
+          # Prázdné slovo "leží" v každé buňce a každém směru, stejně
+          # jako u rekurzivní varianty.
+          found_word_locations = [[] for _ in range(rows * cols * len(DIRECTIONS))]
+        for r, c in positions_by_letter.get(word[:1], []) if word else []:
+          for dr, dc in DIRECTIONS:
+            end_r, end_c = r + dr * (len(word) - 1), c + dc * (len(word) - 1)
+            if not (0 <= end_r < rows and 0 <= end_c < cols):
+              continue
+            if all(matrix[r + dr * i][c + dc * i] == word[i] for i in range(1, len(word))):
+              found_word_locations.append([(r + dr * i, c + dc * i) for i in range(len(word))])
+        if found_word_locations:
+          found_words[word] = found_word_locations
+
+    return found_words
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+import batch_solver
+
+MATRIX = ["KALT", "LLPU", "AKTA"]
+
+
+def read_results(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_directory_and_jsonl_round_trip(tmp_path, workers):
+    puzzle_dir = tmp_path / "puzzles"
+    puzzle_dir.mkdir()
+    (puzzle_dir / "a.txt").write_text("\n".join(MATRIX) + "\n\nKAL TA XYZ\n", encoding="utf-8")
+    jsonl = tmp_path / "puzzles.jsonl"
+    jsonl.write_text(json.dumps({"id": "a", "matrix": MATRIX, "words": ["kal", "TA", "XYZ"]}) + "\n", encoding="utf-8")
+
+    for source in (puzzle_dir, jsonl):
+        output = tmp_path / "results.jsonl"
+        assert batch_solver.main([str(source), "-o", str(output), "-j", str(workers)]) == 0
+        [result] = read_results(output)
+        assert result["found_words"] == {"KAL": [[[0, 0], [0, 1], [0, 2]]], "TA": [[[2, 2], [2, 3]]]}
+        assert result["missing_words"] == ["XYZ"]
+        assert result["remaining_letters"] == "TLLPUAK"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_malformed_records_do_not_stop_the_run(tmp_path, workers):
+    lines = [
+        json.dumps({"matrix": ["AB", "CD"], "words": "AB"}),
+        "[1, 2]",
+        "not json",
+        json.dumps({"matrix": 5}),
+        json.dumps({"matrix": "AB", "words": 5}),
+        json.dumps({"matrix": ["AB", "C"], "words": "AB"}),
+        json.dumps({"matrix": ["AB", "CD"], "words": "DC"}),
+    ]
+    jsonl = tmp_path / "puzzles.jsonl"
+    jsonl.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    output = tmp_path / "results.jsonl"
+
+    assert batch_solver.main([str(jsonl), "-o", str(output), "-j", str(workers)]) == 1
+    results = read_results(output)
+    assert [result["id"] for result in results] == [1, 2, 3, 4, 5, 6, 7]
+    assert [("error" in result) for result in results] == [False, True, True, True, True, True, False]
+    assert results[-1]["found_words"] == {"DC": [[[1, 1], [1, 0]]]}
+
+
+_solve_puzzle = batch_solver.solve_puzzle
+
+
+def _crash_on_second_puzzle(puzzle):
+    # Simuluje pád pracovního procesu (např. OOM) u zadání s id 2.
+    if puzzle.get("id") == 2:
+        os._exit(1)
+    return _solve_puzzle(puzzle)
+
+
+def test_worker_crash_does_not_stop_the_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_solver, "solve_puzzle", _crash_on_second_puzzle)
+    jsonl = tmp_path / "puzzles.jsonl"
+    puzzle = json.dumps({"matrix": MATRIX, "words": "KAL TA"})
+    jsonl.write_text("\n".join([puzzle] * 20) + "\n", encoding="utf-8")
+    output = tmp_path / "results.jsonl"
+
+    assert batch_solver.main([str(jsonl), "-o", str(output), "-j", "2", "--max-pending", "2"]) == 1
+    results = read_results(output)
+    assert [result["id"] for result in results] == list(range(1, 21))
+    assert "BrokenProcessPool" in results[1]["error"]
+    assert all("error" not in result for result in results[-10:])
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+import sys
+
+import pytest
+
+import benchmark
+
+
+def test_all_backends_agree_and_report_memory():
+    records = benchmark.run_benchmark([10, 20], list(benchmark.SOLVER_BACKENDS))
+    assert len(records) == 2 * len(benchmark.SOLVER_BACKENDS)
+    assert all(record["matches_reference"] for record in records)
+    if benchmark.resource is not None and sys.platform != "win32":
+        assert all(record["peak_memory_bytes"] >= 0 for record in records)
+
+
+def test_repeat_below_one_is_rejected():
+    with pytest.raises(SystemExit):
+        benchmark.main(["--repeat", "0", "--sizes", "10"])
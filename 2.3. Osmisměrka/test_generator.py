@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from generator import generate_puzzle
+from osmismerka import DIRECTIONS
+
+
+def planted_paths(puzzle):
+    for placement in puzzle["placements"]:
+        dr, dc = placement["direction"]
+        word = placement["word"]
+        yield word, [(placement["row"] + dr * i, placement["col"] + dc * i) for i in range(len(word))]
+
+
+def test_same_seed_gives_same_puzzle():
+    assert generate_puzzle(30, 20, seed=7) == generate_puzzle(30, 20, seed=7)
+    assert generate_puzzle(30, 20, seed=7)["matrix"] != generate_puzzle(30, 20, seed=8)["matrix"]
+
+
+def test_placements_are_in_the_grid():
+    for seed in range(20):
+        puzzle = generate_puzzle(15, 12, seed=seed, overlap=0.8)
+        rows, cols = len(puzzle["matrix"]), len(puzzle["matrix"][0])
+        assert puzzle["placements"]
+        for placement in puzzle["placements"]:
+            assert tuple(placement["direction"]) in DIRECTIONS
+        for word, path in planted_paths(puzzle):
+            assert all(0 <= r < rows and 0 <= c < cols for r, c in path)
+            assert "".join(puzzle["matrix"][r][c] for r, c in path) == word
+
+
+def test_zero_overlap_never_shares_cells():
+    for seed in range(20):
+        puzzle = generate_puzzle(20, 20, seed=seed, overlap=0)
+        used = set()
+        for _, path in planted_paths(puzzle):
+            assert used.isdisjoint(path)
+            used.update(path)
+
+
+def test_words_longer_than_grid_are_skipped():
+    puzzle = generate_puzzle(3, 4, dictionary=["KOSMONAUT", "TAKTIKA"], seed=1)
+    assert puzzle["placements"] == []
+    assert len(puzzle["matrix"]) == 3 and all(len(row) == 4 for row in puzzle["matrix"])
+
+    puzzle = generate_puzzle(3, 4, dictionary=["KOSMONAUT", "KOS"], seed=1)
+    assert {placement["word"] for placement in puzzle["placements"]} == {"KOS"}
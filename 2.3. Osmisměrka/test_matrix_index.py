@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from generator import generate_puzzle
+from matrix_index import MatrixIndex
+from osmismerka import DIRECTIONS, find_words_in_matrix
+
+
+def brute_force_query(matrix, pattern):
+    # Projde všechny buňky a směry a vrátí totéž, co má vrátit
+    # MatrixIndex.query (slovo -> cesty, seřazeno podle slova).
+    rows, cols = len(matrix), len(matrix[0])
+    found = {}
+    if not pattern:
+        return found
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in DIRECTIONS:
+                path = [(r + dr * i, c + dc * i) for i in range(len(pattern))]
+                if not all(0 <= pr < rows and 0 <= pc < cols for pr, pc in path):
+                    continue
+                word = "".join(matrix[pr][pc] for pr, pc in path)
+                if all(p == "?" or p == ch for p, ch in zip(pattern, word)):
+                    found.setdefault(word, []).append(path)
+    return dict(sorted(found.items()))
+
+
+def random_matrix(rng, rows, cols, alphabet="ABK"):
+    return [[rng.choice(alphabet) for _ in range(cols)] for _ in range(rows)]
+
+
+def random_pattern(rng, length, alphabet="ABK?"):
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_query_matches_brute_force(seed):
+    rng = random.Random(seed)
+    rows, cols = rng.randint(1, 8), rng.randint(1, 8)
+    matrix = random_matrix(rng, rows, cols)
+    index = MatrixIndex(matrix)
+    patterns = ["", "?", "??", "?" * max(rows, cols), "?" * (max(rows, cols) + 1),
+                "A" * (max(rows, cols) + 1), "K?A", "A?" * (max(rows, cols) + 1)]
+    patterns += [random_pattern(rng, rng.randint(1, 5)) for _ in range(10)]
+    for pattern in patterns:
+        assert index.query(pattern) == brute_force_query(matrix, pattern), pattern
+
+
+@pytest.mark.parametrize("rows, cols", [(1, 1), (1, 7), (7, 1)])
+def test_single_row_and_column_grids(rows, cols):
+    matrix = random_matrix(random.Random(rows * 10 + cols), rows, cols)
+    index = MatrixIndex(matrix)
+    for pattern in ["", "?", "A", "AB", "B?", "???", "?" * 7, "?" * 8, "K?A?B"]:
+        assert index.query(pattern) == brute_force_query(matrix, pattern), pattern
+
+
+def test_find_words_matches_scanning_solver():
+    puzzle = generate_puzzle(25, 18, seed=3)
+    matrix = [list(row) for row in puzzle["matrix"]]
+    words = puzzle["words"] + ["", "A", "XYZ", "KOSMONAUTKOSMONAUTKOSMONAUT"]
+    assert MatrixIndex(matrix).find_words(words) == find_words_in_matrix(matrix, words)
@@ -6,107 +6,8 @@
 
 import streamlit as st
 
-def text_to_matrix(text_input):
-    # Funcke která bere text jako input, poté ho rozdelí
-    # na řádky na základě '\n' indikátoru nového řádku. Individualní
-    # písmena jsou populována do matice, ktera je poté funkcí vrácena. 
-    rows = text_input.strip().split('\n')
-    matrix = [list(row.strip()) for row in rows]
-    return matrix
-
-def find_words_in_matrix(matrix, word_list):
-    # Tato funkce slouží ke hledáni slov v matici (osmisměrky). 
-    # Hledá v ní všechna slova ze zadaného seznamu slov (word_list). 
-    # Hledání probíhá horizontálně, vertikálně a diagonálně ve 
-    # všech osmi směrech.  
-    found_words = {}
-    rows = len(matrix)
-    cols = len(matrix[0]) if rows > 0 else 0
-    
-    def search(r, c, word, index, direction):
-        # Tato vnitřní funkce je rekurzivní a slouží k prohledání 
-        # jednoho konkrétního slova (word) z dané počáteční pozice (r, c) 
-        # v zadaném směru z tuplu direction.
-        
-        if index == len(word):
-          return True, []
-      
-        if not (0 <= r < rows and 0 <= c < cols and matrix[r][c] == word[index]):
-          return False, None
-      
-        next_r, next_c = r + direction[0], c + direction[1]
-        found, rest_of_path = search(next_r, next_c, word, index + 1, direction)
-        if found:
-          return True, [(r, c)] + rest_of_path
-        return False, None
-    
-    directions = [(0, 1), (1, 0), (1, 1), (1, -1), (0, -1), (-1, 0), (-1, 1), (-1, -1)]
-
-
-    # Následující loop na začátku pro každé hledané word se 
-    # inicializuje prázdný seznam found_word_locations, který 
-    # ukládá všechny nalezené cesty (sekvence souřadnic) pro dané 
-    # slovo v matici. Pro každé slovo iteruje přes všechny buňky matice 
-    # jako potenciální počátek a pro každý směr volá rekurzivní funkci 
-    # search, která ověřuje existenci slova. Pokud se slovo najde, uloží se
-    # seznam souřadnic jeho písmen do seznamu found_word_locations pro 
-    # dané slovo. Nakonec, pokud pro dané slovo existují nějaké nalezené pozice, 
-    # uloží se toto slovo jako klíč a seznam jeho pozic jako hodnota do 
-    # slovníku found_words, který je na konci funkce vrácen.
-  
-    for word in word_list:
-        found_word_locations = []
-        for r in range(rows):
-          for c in range(cols):
-            for direction in directions:
-              found, path = search(r, c, word, 0, direction)
-              if found:
-                found_word_locations.append(path)
-        if found_word_locations:
-          found_words[word] = found_word_locations
-    
-    return found_words
-
-def find_remaining_letters(matrix, found_words): 
-    # Tato funkce má za úkol najít všechna písmena v původní 
-    # matici, která nejsou součástí žádného z nalezených slov. 
-    # Poté tato zbývající písmena spojí do jednoho slova.
-    rows = len(matrix)
-    cols = len(matrix[0]) if rows > 0 else 0
-    colored_cells = set()
-    remaining_letters = []
-    
-    
-    # Tento trojitý for loop iteruje přes všechny nalezené pozice 
-    # písmen, které tvoří hledaná slova. Začíná procházením všech 
-    # seznamů pozic (locations_list) uložených jako hodnoty ve 
-    # slovníku found_words. Pro každý takový seznam 
-    # (který reprezentuje všechny výskyty jednoho slova) 
-    # iteruje přes jednotlivé nalezené cesty (locations), 
-    # kde každá cesta je seznamem souřadnic (r, c) písmen 
-    # tvořících daný výskyt slova. V nejvnitřnější smyčce se 
-    # pak pro každou souřadnici (r, c) písmene, které je 
-    # součástí nalezeného slova, tato souřadnice přidá do 
-    # množiny colored_cells. Množina je použita proto, aby 
-    # se zajistilo, že každá souřadnice je uložena pouze jednou, 
-    # i když se dané písmeno může vyskytovat ve více nalezených slovech.
-    for locations_list in found_words.values():
-      for locations in locations_list:
-        for r, c in locations:
-          colored_cells.add((r, c))
-    
-    
-    # Tento loop iteruje matici po řádcích a sloupcích. Pro 
-    # každou buňku zkontroluje, zda její souřadnice nejsou v 
-    # colored_cells (souřadnice písmen nalezených slov). 
-    # Pokud nejsou, písmeno z této buňky se přidá do 
-    # seznamu remaining_letters.
-    for r in range(rows):
-      for c in range(cols):
-        if (r, c) not in colored_cells:
-          remaining_letters.append(matrix[r][c])
-    
-    return "".join(remaining_letters)
+from osmismerka import text_to_matrix, find_remaining_letters
+from matrix_index import MatrixIndex
 
 def visualize_matrix_streamlit(matrix, found_words):
     # Tato funkce je zodpovědná za vizualizaci matice 
@@ -206,6 +107,8 @@ def main():
         st.session_state["found_words"] = {}
     if "words_found" not in st.session_state:
         st.session_state["words_found"] = False
+    if "matrix_index" not in st.session_state:
+        st.session_state["matrix_index"] = None
 
     text_input = st.text_area("Enter the letter matrix (each row on a new line):", """KALTJSHODA
 LLPUKLTOAT
@@ -226,8 +129,12 @@ AIAKOSTKAY""")
         if text_input:
             matrix = text_to_matrix(text_input.strip())
             if matrix and all(len(row) == len(matrix[0]) for row in matrix):
+                # Index se staví jen při změně matice, další hledání
+                # nad stejnou maticí ho znovu použije.
+                if st.session_state["matrix_index"] is None or st.session_state["matrix"] != matrix:
+                    st.session_state["matrix_index"] = MatrixIndex(matrix)
                 st.session_state["matrix"] = matrix
-                st.session_state["found_words"] = find_words_in_matrix(matrix, word_list)
+                st.session_state["found_words"] = st.session_state["matrix_index"].find_words(word_list)
                 st.session_state["words_found"] = True  # Indicate that words have been found
             elif not matrix:
                 st.error("Please enter a valid letter matrix.")
@@ -243,6 +150,23 @@ AIAKOSTKAY""")
             remaining_word = find_remaining_letters(st.session_state["matrix"], st.session_state["found_words"])
             st.subheader("Remaining Letters Form:")
             st.markdown(f"**{remaining_word}**")
+
+        # Dotaz na vzor nad indexem uloženým v session state. Znak '?'
+        # zastupuje libovolné písmeno, např. "P????" najde všechna
+        # pětipísmenná slova začínající na P.
+        pattern = st.text_input("Search for a pattern ('?' matches any letter):", "K?AS").strip().upper()
+        if st.button("Search Pattern") and pattern:
+            matches = st.session_state["matrix_index"].query(pattern)
+            st.subheader("Pattern Matches")
+            if matches:
+                matches_html = "<ul>"
+                for word, locations_list in matches.items():
+                    starts = ", ".join(f"({locations[0][0]}, {locations[0][1]})" for locations in locations_list)
+                    matches_html += f'<li><b>{word}</b> &ndash; {starts}</li>'
+                matches_html += "</ul>"
+                st.markdown(matches_html, unsafe_allow_html=True)
+            else:
+                st.info(f"No matches for {pattern} in the matrix.")
 if __name__ == "__main__":
   main()
 